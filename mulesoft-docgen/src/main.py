@@ -19,7 +19,7 @@ import zipfile
 import traceback
 from jinja2.exceptions import TemplateSyntaxError
 
-from .parser.xml_parser import XmlParser
+from .parser.xml_parser import XmlParser, CACHE_ENV_VAR
 from .model.interface import Interface
 from .generator.html_generator import generate_html
 
@@ -70,8 +70,14 @@ def main():
     parser = argparse.ArgumentParser(description='Generate documentation for MuleSoft interfaces')
     parser.add_argument('--input', required=True, help='Input directory containing MuleSoft source files')
     parser.add_argument('--output', required=True, help='Output directory for generated documentation')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse parsed flows of unchanged XML files from the per-user cache')
     args = parser.parse_args()
     
+    # Set through the environment so worker processes see it too
+    if args.cache:
+        os.environ[CACHE_ENV_VAR] = '1'
+    
     # Create output directory if it doesn't exist
     os.makedirs(args.output, exist_ok=True)
     
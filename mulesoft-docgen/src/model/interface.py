@@ -54,6 +54,59 @@ class Connector:
         return cls(data.get('type', 'unknown'), data.get('attributes', {}))
 
 
+class Processor:
+    """
+    Represents a processor (component) in a MuleSoft flow.
+    
+    Uses __slots__ to keep per-processor memory low. Read access also works
+    dict-style (get, [] and in), so processor records that are plain dicts
+    and Processor instances can be handled by the same code.
+    """
+    
+    __slots__ = ('type', 'attributes', 'transformation', 'file_operation', 'routes')
+    
+    def __init__(self, processor_type: str, attributes: Dict[str, str]):
+        """
+        Initialize a processor with its type and attributes.
+        
+        Args:
+            processor_type: Local name of the processor element
+            attributes: Processor attributes from XML
+        """
+        self.type = processor_type
+        self.attributes = attributes
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a processor field by name.
+        
+        Args:
+            key: Field name
+            default: Value returned when the field is not set
+            
+        Returns:
+            Field value or default
+        """
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ and hasattr(self, key)
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{key}={getattr(self, key)!r}" for key in self.__slots__ if hasattr(self, key))
+        return f"Processor({fields})"
+
+
 class Flow:
     """Represents a MuleSoft flow or sub-flow."""
     
@@ -8,12 +8,212 @@ including Maven project information, dependencies, and build details.
 import os
 import re
 import json
+import logging
 import zipfile
-from typing import Dict, List, Any, Optional, Union
+import zlib
+from io import BytesIO
+from typing import Dict, Iterator, List, Any, Optional, Union
 from pathlib import Path
-from lxml import etree
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+
+# The __main__ example, run as "python src/parser/metadata_extractor.py", has no
+# parent package and src/parser on sys.path, so it imports the helpers directly
+if __package__:
+    from .metadata_parser import iter_properties, parse_manifest
+else:
+    from metadata_parser import iter_properties, parse_manifest
+
+logger = logging.getLogger(__name__)
+
+# Errors raised when a JAR or one of its entries cannot be read
+JAR_READ_ERRORS = (OSError, KeyError, zipfile.BadZipFile, zlib.error)
+
+# Location of the manifest inside a JAR
+MANIFEST_PATH = 'META-INF/MANIFEST.MF'
+
+# Manifest attributes mapped to their app_info and build_info keys
+MANIFEST_APP_FIELDS = {
+    'Implementation-Title': 'title',
+    'Implementation-Version': 'version'
+}
+MANIFEST_BUILD_FIELDS = {
+    'Built-By': 'built_by',
+    'Build-Jdk': 'build_jdk',
+    'Created-By': 'created_by',
+    'Build-Date': 'build_date'
+}
+
+# Maven POM namespace and the qualified tags read while streaming a POM
+POM_NAMESPACE = 'http://maven.apache.org/POM/4.0.0'
+_POM_GROUP_ID = f'{{{POM_NAMESPACE}}}groupId'
+_POM_ARTIFACT_ID = f'{{{POM_NAMESPACE}}}artifactId'
+_POM_VERSION = f'{{{POM_NAMESPACE}}}version'
+_POM_NAME = f'{{{POM_NAMESPACE}}}name'
+_POM_DESCRIPTION = f'{{{POM_NAMESPACE}}}description'
+_POM_PARENT = f'{{{POM_NAMESPACE}}}parent'
+_POM_PROPERTIES = f'{{{POM_NAMESPACE}}}properties'
+_POM_DEPENDENCIES = f'{{{POM_NAMESPACE}}}dependencies'
+_POM_DEPENDENCY = f'{{{POM_NAMESPACE}}}dependency'
+_POM_DEPENDENCY_MANAGEMENT = f'{{{POM_NAMESPACE}}}dependencyManagement'
+_POM_BUILD = f'{{{POM_NAMESPACE}}}build'
+_POM_PLUGIN_MANAGEMENT = f'{{{POM_NAMESPACE}}}pluginManagement'
+_POM_PLUGINS = f'{{{POM_NAMESPACE}}}plugins'
+_POM_PLUGIN = f'{{{POM_NAMESPACE}}}plugin'
+_POM_SCOPE = f'{{{POM_NAMESPACE}}}scope'
+_POM_CLASSIFIER = f'{{{POM_NAMESPACE}}}classifier'
+_POM_CONFIGURATION = f'{{{POM_NAMESPACE}}}configuration'
+
+# Project-level elements mapped to their maven_info keys
+_POM_PROJECT_FIELDS = {
+    _POM_GROUP_ID: 'group_id',
+    _POM_ARTIFACT_ID: 'artifact_id',
+    _POM_VERSION: 'version',
+    _POM_NAME: 'name',
+    _POM_DESCRIPTION: 'description'
+}
+
+_POM_STREAMED_TAGS = tuple(_POM_PROJECT_FIELDS) + (_POM_PARENT, _POM_PROPERTIES, _POM_DEPENDENCIES, _POM_PLUGINS)
+
+# Property keys and file names that mark a property as secure
+_SECURE_KEY_RE = re.compile(r'password|secret|key|token', re.IGNORECASE)
+_SECURE_FILE_RE = re.compile(r'secure', re.IGNORECASE)
+
+# RAML root keys; title and version always sit in the document header
+_RAML_TITLE_RE = re.compile(r'^title:\s*(.*)', re.MULTILINE)
+_RAML_VERSION_RE = re.compile(r'^version:\s*(.*)', re.MULTILINE)
+RAML_HEADER_SIZE = 4096
+
+# File extensions recognised as API specifications
+API_SPEC_EXTENSIONS = ('raml', 'yaml', 'json')
+
+# Suffixes of properties files, secure or not, checked with one endswith call
+PROPERTIES_SUFFIXES = ('.properties', '.secure.properties')
+
+# Directories holding build output or VCS data rather than project sources
+SKIPPED_DIRECTORIES = ('target', '.git')
+
+
+def _iter_properties_files(dir_path: str) -> Iterator[str]:
+    """
+    Recursively yield paths of properties files below a directory.
+    
+    Uses os.scandir so file types come from the directory entries themselves
+    instead of an extra stat call per file. Build output and VCS directories
+    are not descended into, and unreadable directories are skipped like
+    os.walk does.
+    
+    Args:
+        dir_path: Directory to scan
+        
+    Yields:
+        Path of each properties file found
+    """
+    try:
+        entries = os.scandir(dir_path)
+    except OSError as e:
+        logger.debug("Skipping unreadable directory %s: %s", dir_path, e)
+        return
+    
+    with entries:
+        try:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRECTORIES:
+                        yield from _iter_properties_files(entry.path)
+                elif entry.name.endswith(PROPERTIES_SUFFIXES):
+                    yield entry.path
+        except OSError as e:
+            logger.debug("Stopped reading directory %s: %s", dir_path, e)
+
+
+def _is_pom_section(elem, *ancestors: str) -> bool:
+    """
+    Check whether an element sits directly below the POM project element.
+    
+    Args:
+        elem: Element to check
+        ancestors: Tags of the intermediate ancestors, innermost first
+        
+    Returns:
+        True if the element's ancestors match and end at the project element
+    """
+    parent = elem.getparent()
+    for tag in ancestors:
+        if parent is None or parent.tag != tag:
+            return False
+        parent = parent.getparent()
+    return parent is not None and parent.getparent() is None
+
+
+def _release_element(elem) -> None:
+    """
+    Free a processed element and its preceding siblings during iterparse.
+    
+    Args:
+        elem: Element that has been fully processed
+    """
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def _build_dependency(dep) -> Dict[str, Optional[str]]:
+    """
+    Build the metadata record for a POM dependency element.
+    
+    Args:
+        dep: dependency element
+        
+    Returns:
+        Dictionary with the dependency coordinates
+    """
+    findtext = dep.findtext
+    dep_info = {
+        'group_id': findtext(_POM_GROUP_ID) or None,
+        'artifact_id': findtext(_POM_ARTIFACT_ID) or None,
+        'version': findtext(_POM_VERSION) or None
+    }
+    
+    # Optional dependency attributes
+    scope = findtext(_POM_SCOPE)
+    if scope:
+        dep_info['scope'] = scope
+    
+    classifier = findtext(_POM_CLASSIFIER)
+    if classifier:
+        dep_info['classifier'] = classifier
+    
+    return dep_info
+
+
+def _build_plugin(plugin) -> Dict[str, Any]:
+    """
+    Build the metadata record for a POM plugin element.
+    
+    Args:
+        plugin: plugin element
+        
+    Returns:
+        Dictionary with the plugin coordinates and configuration
+    """
+    findtext = plugin.findtext
+    plugin_info = {
+        'group_id': findtext(_POM_GROUP_ID) or None,
+        'artifact_id': findtext(_POM_ARTIFACT_ID) or None,
+        'version': findtext(_POM_VERSION) or None
+    }
+    
+    # Extract plugin configuration
+    config_elem = plugin.find(_POM_CONFIGURATION)
+    if config_elem is not None:
+        configuration = {}
+        for config in config_elem:
+            config_tag = config.tag.split('}')[-1] if '}' in config.tag else config.tag
+            configuration[config_tag] = config.text
+        
+        if configuration:
+            plugin_info['configuration'] = configuration
+    
+    return plugin_info
 
 
 class MetadataExtractor:
@@ -44,14 +244,34 @@ class MetadataExtractor:
             raise FileNotFoundError(f"JAR file not found: {jar_path}")
         
         with zipfile.ZipFile(jar_path) as jar:
-            # Extract application info from manifest
-            self._extract_manifest(jar)
+            pom_path = None
+            pom_depth = None
+            property_files = []
+            
+            # Classify every entry in a single pass over the central directory
+            for info in jar.infolist():
+                name = info.filename
+                
+                if name == MANIFEST_PATH:
+                    # Extract application info from manifest
+                    self._extract_manifest(jar, name)
+                
+                elif name.endswith('pom.xml'):
+                    # Keep the first root pom.xml, otherwise the shallowest one
+                    depth = name.count('/')
+                    if pom_path is None or (pom_depth > 1 and depth < pom_depth):
+                        pom_path = name
+                        pom_depth = depth
+                
+                elif name.endswith(PROPERTIES_SUFFIXES):
+                    property_files.append(name)
             
             # Extract Maven info from pom.xml
-            self._extract_pom_info(jar)
+            if pom_path is not None:
+                self._extract_pom_info(jar, pom_path)
             
             # Extract secure properties
-            self._extract_secure_properties(jar)
+            self._extract_secure_properties(jar, property_files)
             
         return self.metadata
     
@@ -74,10 +294,8 @@ class MetadataExtractor:
             self._extract_pom_from_file(pom_path)
         
         # Look for secure properties files
-        for root, _, files in os.walk(dir_path):
-            for file in files:
-                if file.endswith('.secure.properties') or file.endswith('.properties'):
-                    self._extract_properties_from_file(os.path.join(root, file))
+        for file_path in _iter_properties_files(dir_path):
+            self._extract_properties_from_file(file_path)
         
         # Extract API specifications if available
         api_dir = os.path.join(dir_path, 'src', 'main', 'resources', 'api')
@@ -86,56 +304,41 @@ class MetadataExtractor:
         
         return self.metadata
     
-    def _extract_manifest(self, jar: zipfile.ZipFile) -> None:
+    def _extract_manifest(self, jar: zipfile.ZipFile, manifest_path: str) -> None:
         """
         Extract metadata from the JAR manifest.
         
         Args:
             jar: ZipFile object for the JAR
+            manifest_path: Entry name of the manifest
         """
         try:
-            if 'META-INF/MANIFEST.MF' in jar.namelist():
-                manifest_data = jar.read('META-INF/MANIFEST.MF').decode('utf-8')
-                
-                # Parse manifest entries
-                for line in manifest_data.splitlines():
-                    if not line or ': ' not in line:
-                        continue
-                    
-                    key, value = line.split(': ', 1)
-                    if key == 'Implementation-Title':
-                        self.metadata['app_info']['title'] = value
-                    elif key == 'Implementation-Version':
-                        self.metadata['app_info']['version'] = value
-                    elif key == 'Built-By':
-                        self.metadata['build_info']['built_by'] = value
-                    elif key == 'Build-Jdk':
-                        self.metadata['build_info']['build_jdk'] = value
-                    elif key == 'Created-By':
-                        self.metadata['build_info']['created_by'] = value
-                    elif key == 'Build-Date':
-                        self.metadata['build_info']['build_date'] = value
-        except Exception as e:
-            print(f"Error reading manifest: {str(e)}")
+            manifest = parse_manifest(jar.read(manifest_path))
+            
+            for key, field in MANIFEST_APP_FIELDS.items():
+                if key in manifest:
+                    self.metadata['app_info'][field] = manifest[key]
+            
+            for key, field in MANIFEST_BUILD_FIELDS.items():
+                if key in manifest:
+                    self.metadata['build_info'][field] = manifest[key]
+        except JAR_READ_ERRORS + (UnicodeDecodeError,) as e:
+            logger.warning("Error reading manifest: %s", e)
     
-    def _extract_pom_info(self, jar: zipfile.ZipFile) -> None:
+    def _extract_pom_info(self, jar: zipfile.ZipFile, pom_path: str) -> None:
         """
         Extract Maven project information from pom.xml in a JAR.
         
         Args:
             jar: ZipFile object for the JAR
+            pom_path: Entry name of the pom.xml to parse
         """
         try:
-            pom_files = [name for name in jar.namelist() if name.endswith('pom.xml')]
+            pom_content = jar.read(pom_path)
             
-            if pom_files:
-                # Choose the root pom.xml if available, otherwise just use the first one
-                pom_path = next((f for f in pom_files if f.count('/') <= 1), pom_files[0])
-                pom_content = jar.read(pom_path).decode('utf-8')
-                
-                self._parse_pom_content(pom_content)
-        except Exception as e:
-            print(f"Error extracting POM info: {str(e)}")
+            self._parse_pom_content(pom_content)
+        except JAR_READ_ERRORS as e:
+            logger.warning("Error extracting POM info: %s", e)
     
     def _extract_pom_from_file(self, file_path: str) -> None:
         """
@@ -145,121 +348,94 @@ class MetadataExtractor:
             file_path: Path to the pom.xml file
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 pom_content = f.read()
                 
             self._parse_pom_content(pom_content)
-        except Exception as e:
-            print(f"Error reading POM file: {str(e)}")
+        except OSError as e:
+            logger.warning("Error reading POM file: %s", e)
     
-    def _parse_pom_content(self, pom_content: str) -> None:
+    def _parse_pom_content(self, pom_content: bytes) -> None:
         """
         Parse Maven POM XML content.
         
+        The POM is streamed with iterparse and each section is released once
+        it has been read, so memory use does not grow with the number of
+        managed dependencies or plugins.
+        
         Args:
-            pom_content: POM XML content as string
+            pom_content: Raw POM XML content
         """
+        # lxml is only needed for POMs; importing it lazily keeps start-up cheap
+        from lxml import etree
+        
         try:
-            # Parse XML safely
-            root = ET.fromstring(pom_content)
-            
-            # Define XML namespaces
-            ns = {'m': 'http://maven.apache.org/POM/4.0.0'}
-            
-            # Extract groupId, artifactId, version
-            group_id = self._find_element_text(root, './/m:groupId', ns)
-            artifact_id = self._find_element_text(root, './/m:artifactId', ns)
-            version = self._find_element_text(root, './/m:version', ns)
-            name = self._find_element_text(root, './/m:name', ns)
-            description = self._find_element_text(root, './/m:description', ns)
-            
-            # Update metadata
-            self.metadata['maven_info'] = {
-                'group_id': group_id,
-                'artifact_id': artifact_id,
-                'version': version,
-                'name': name,
-                'description': description
-            }
+            maven_info = {field: None for field in _POM_PROJECT_FIELDS.values()}
+            parent_info = None
+            properties = {}
+            dependencies = []
+            plugins = []
             
-            # Extract parent info if present
-            parent = root.find('.//m:parent', ns)
-            if parent is not None:
-                parent_group_id = self._find_element_text(parent, './m:groupId', ns)
-                parent_artifact_id = self._find_element_text(parent, './m:artifactId', ns)
-                parent_version = self._find_element_text(parent, './m:version', ns)
+            context = etree.iterparse(BytesIO(pom_content), events=('end',),
+                                      tag=_POM_STREAMED_TAGS, remove_comments=True)
+            for _, elem in context:
+                tag = elem.tag
                 
-                self.metadata['maven_info']['parent'] = {
-                    'group_id': parent_group_id,
-                    'artifact_id': parent_artifact_id,
-                    'version': parent_version
-                }
-            
-            # Extract properties
-            properties_elem = root.find('.//m:properties', ns)
-            if properties_elem is not None:
-                properties = {}
-                for prop in properties_elem:
-                    tag = prop.tag.split('}')[-1] if '}' in prop.tag else prop.tag
-                    properties[tag] = prop.text
+                if tag in _POM_PROJECT_FIELDS:
+                    # Skip coordinates that belong to a parent, dependency or plugin
+                    if not _is_pom_section(elem):
+                        continue
+                    maven_info[_POM_PROJECT_FIELDS[tag]] = elem.text or None
+                    _release_element(elem)
                 
-                if properties:
-                    self.metadata['maven_info']['properties'] = properties
-            
-            # Extract dependencies
-            dependencies = []
-            deps_elem = root.find('.//m:dependencies', ns)
-            if deps_elem is not None:
-                for dep in deps_elem.findall('./m:dependency', ns):
-                    dep_info = {
-                        'group_id': self._find_element_text(dep, './m:groupId', ns),
-                        'artifact_id': self._find_element_text(dep, './m:artifactId', ns),
-                        'version': self._find_element_text(dep, './m:version', ns)
-                    }
-                    
-                    # Optional dependency attributes
-                    scope = self._find_element_text(dep, './m:scope', ns)
-                    if scope:
-                        dep_info['scope'] = scope
-                    
-                    classifier = self._find_element_text(dep, './m:classifier', ns)
-                    if classifier:
-                        dep_info['classifier'] = classifier
-                    
-                    dependencies.append(dep_info)
+                elif tag == _POM_PARENT:
+                    if _is_pom_section(elem):
+                        parent_info = {
+                            'group_id': self._find_element_text(elem, _POM_GROUP_ID),
+                            'artifact_id': self._find_element_text(elem, _POM_ARTIFACT_ID),
+                            'version': self._find_element_text(elem, _POM_VERSION)
+                        }
+                        _release_element(elem)
+                
+                elif tag == _POM_PROPERTIES:
+                    if _is_pom_section(elem):
+                        for prop in elem:
+                            prop_tag = prop.tag.split('}')[-1] if '}' in prop.tag else prop.tag
+                            properties[prop_tag] = prop.text
+                        _release_element(elem)
+                
+                elif tag == _POM_DEPENDENCIES:
+                    if _is_pom_section(elem):
+                        dependencies = [_build_dependency(dep) for dep in elem.iterchildren(_POM_DEPENDENCY)]
+                        _release_element(elem)
+                    elif _is_pom_section(elem, _POM_DEPENDENCY_MANAGEMENT):
+                        # Managed dependencies are not reported but still freed
+                        _release_element(elem)
+                
+                elif tag == _POM_PLUGINS:
+                    if _is_pom_section(elem, _POM_BUILD):
+                        plugins = [_build_plugin(plugin) for plugin in elem.iterchildren(_POM_PLUGIN)]
+                        _release_element(elem)
+                    elif _is_pom_section(elem, _POM_PLUGIN_MANAGEMENT, _POM_BUILD):
+                        _release_element(elem)
             
-            self.metadata['dependencies'] = dependencies
+            # groupId and version are inherited from the parent when omitted
+            if parent_info is not None:
+                for field in ('group_id', 'version'):
+                    if maven_info[field] is None:
+                        maven_info[field] = parent_info[field]
+                maven_info['parent'] = parent_info
             
-            # Extract plugins
-            plugins = []
-            build_elem = root.find('.//m:build', ns)
-            if build_elem is not None:
-                plugins_elem = build_elem.find('./m:plugins', ns)
-                if plugins_elem is not None:
-                    for plugin in plugins_elem.findall('./m:plugin', ns):
-                        plugin_info = {
-                            'group_id': self._find_element_text(plugin, './m:groupId', ns),
-                            'artifact_id': self._find_element_text(plugin, './m:artifactId', ns),
-                            'version': self._find_element_text(plugin, './m:version', ns)
-                        }
-                        
-                        # Extract plugin configuration
-                        config_elem = plugin.find('./m:configuration', ns)
-                        if config_elem is not None:
-                            configuration = {}
-                            for config in config_elem:
-                                tag = config.tag.split('}')[-1] if '}' in config.tag else config.tag
-                                configuration[tag] = config.text
-                            
-                            if configuration:
-                                plugin_info['configuration'] = configuration
-                        
-                        plugins.append(plugin_info)
+            if properties:
+                maven_info['properties'] = properties
             
+            # Update metadata
+            self.metadata['maven_info'] = maven_info
+            self.metadata['dependencies'] = dependencies
             self.metadata['plugins'] = plugins
             
-        except Exception as e:
-            print(f"Error parsing POM content: {str(e)}")
+        except etree.XMLSyntaxError as e:
+            logger.warning("Error parsing POM content: %s", e)
     
     def _find_element_text(self, parent, xpath, namespaces=None) -> Optional[str]:
         """
@@ -276,29 +452,22 @@ class MetadataExtractor:
         element = parent.find(xpath, namespaces)
         return element.text if element is not None and element.text else None
     
-    def _extract_secure_properties(self, jar: zipfile.ZipFile) -> None:
+    def _extract_secure_properties(self, jar: zipfile.ZipFile, property_files: List[str]) -> None:
         """
         Extract secure properties from properties files in a JAR.
         
         Args:
             jar: ZipFile object for the JAR
+            property_files: Entry names of the properties files
         """
-        try:
-            # Look for .properties files
-            property_files = [name for name in jar.namelist() if
-                               name.endswith('.properties') or 
-                               name.endswith('.secure.properties')]
-            
-            for prop_file in property_files:
-                try:
-                    content = jar.read(prop_file).decode('utf-8')
-                    
-                    # Process properties
-                    self._process_properties(content, os.path.basename(prop_file))
-                except Exception as e:
-                    print(f"Error reading property file {prop_file}: {str(e)}")
-        except Exception as e:
-            print(f"Error extracting secure properties: {str(e)}")
+        for prop_file in property_files:
+            try:
+                content = jar.read(prop_file).decode('utf-8')
+                
+                # Process properties
+                self._process_properties(content, os.path.basename(prop_file))
+            except JAR_READ_ERRORS + (UnicodeDecodeError,) as e:
+                logger.warning("Error reading property file %s: %s", prop_file, e)
     
     def _extract_properties_from_file(self, file_path: str) -> None:
         """
@@ -312,8 +481,8 @@ class MetadataExtractor:
                 content = f.read()
                 
             self._process_properties(content, os.path.basename(file_path))
-        except Exception as e:
-            print(f"Error processing properties file {file_path}: {str(e)}")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Error processing properties file %s: %s", file_path, e)
     
     def _process_properties(self, content: str, filename: str) -> None:
         """
@@ -325,31 +494,19 @@ class MetadataExtractor:
         """
         secure_props = []
         
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Check if this might be a secure property
-                is_secure = (
-                    'password' in key.lower() or
-                    'secret' in key.lower() or
-                    'key' in key.lower() or
-                    'token' in key.lower() or
-                    'secure' in filename.lower()
-                )
-                
-                if is_secure:
-                    secure_props.append({
-                        'key': key,
-                        'masked_value': '*****',
-                        'file': filename
-                    })
+        # Every property of a secure properties file is treated as secure
+        secure_in_filename = _SECURE_FILE_RE.search(filename) is not None
+        
+        for key, _ in iter_properties(content):
+            # Check if this might be a secure property
+            is_secure = secure_in_filename or _SECURE_KEY_RE.search(key) is not None
+            
+            if is_secure:
+                secure_props.append({
+                    'key': key,
+                    'masked_value': '*****',
+                    'file': filename
+                })
         
         self.metadata['secure_properties'].extend(secure_props)
     
@@ -363,34 +520,38 @@ class MetadataExtractor:
         api_specs = []
         
         try:
-            for file in os.listdir(api_dir):
-                if file.endswith('.raml') or file.endswith('.yaml') or file.endswith('.json'):
-                    file_path = os.path.join(api_dir, file)
-                    
-                    api_spec = {
-                        'file': file,
-                        'type': file.split('.')[-1].upper(),
-                        'size': os.path.getsize(file_path)
-                    }
-                    
-                    # For RAML files, try to extract the title and version
-                    if file.endswith('.raml'):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            title_match = re.search(r'title:\s*(.*)', content)
-                            version_match = re.search(r'version:\s*(.*)', content)
-                            
-                            if title_match:
-                                api_spec['title'] = title_match.group(1).strip()
-                            if version_match:
-                                api_spec['version'] = version_match.group(1).strip()
-                    
-                    api_specs.append(api_spec)
+            with os.scandir(api_dir) as entries:
+                for entry in entries:
+                    file = entry.name
+                    ext = os.path.splitext(file)[1][1:].lower()
+                    if ext in API_SPEC_EXTENSIONS:
+                        file_path = entry.path
+                        
+                        api_spec = {
+                            'file': file,
+                            'type': ext.upper(),
+                            'size': entry.stat().st_size
+                        }
+                        
+                        # For RAML files, try to extract the title and version
+                        if ext == 'raml':
+                            # Only the header is needed, not the whole specification
+                            with open(file_path, 'r', encoding='utf-8') as f:
+                                content = f.read(RAML_HEADER_SIZE)
+                                title_match = _RAML_TITLE_RE.search(content)
+                                version_match = _RAML_VERSION_RE.search(content)
+                                
+                                if title_match:
+                                    api_spec['title'] = title_match.group(1).strip()
+                                if version_match:
+                                    api_spec['version'] = version_match.group(1).strip()
+                        
+                        api_specs.append(api_spec)
             
             if api_specs:
                 self.metadata['api_specs'] = api_specs
-        except Exception as e:
-            print(f"Error extracting API specs: {str(e)}")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Error extracting API specs: %s", e)
 
 
 def extract_metadata(path: str) -> Dict[str, Any]:
@@ -5,12 +5,57 @@ This module extracts metadata from META-INF and pom.xml files.
 
 import os
 import re
+import logging
+from glob import escape, iglob
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from lxml import etree
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import xml.etree.ElementTree as ET
 import json
-from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def parse_manifest(data: bytes) -> Dict[str, str]:
+    """
+    Parse the attributes of a JAR manifest.
+    
+    The 72-column continuation lines are unfolded with bulk byte replacements
+    before splitting, so no per-line state is needed. Attributes in later
+    sections override earlier ones with the same name.
+    
+    Args:
+        data: Raw MANIFEST.MF content
+        
+    Returns:
+        Dictionary of manifest attributes
+    """
+    data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n').replace(b'\n ', b'')
+    
+    info = {}
+    for line in data.decode('utf-8').split('\n'):
+        key, sep, value = line.partition(':')
+        if sep:
+            info[key.strip()] = value.strip()
+    return info
+
+
+def iter_properties(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    Iterate over the key/value pairs of a Java properties file.
+    
+    Blank lines, comments and lines without an '=' are skipped.
+    
+    Args:
+        text: Properties file content
+        
+    Yields:
+        Tuples of stripped (key, value)
+    """
+    for line in text.splitlines():
+        key, sep, value = line.partition('=')
+        if sep and not line.lstrip().startswith('#'):
+            yield key.strip(), value.strip()
+
 
 class MetadataParser:
     """Parse and extract metadata from MuleSoft applications."""
@@ -24,6 +69,7 @@ class MetadataParser:
         """
         self.jar_dir = jar_dir
         self.meta_inf_dir = os.path.join(jar_dir, 'META-INF')
+        self.maven_dir = os.path.join(self.meta_inf_dir, 'maven')
         
     def extract_metadata(self) -> Dict[str, Any]:
         """
@@ -64,50 +110,24 @@ class MetadataParser:
         if not os.path.exists(manifest_path):
             return None
             
-        info = {}
-        
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                current_key = None
-                current_value = ""
-                
-                for line in f:
-                    line = line.rstrip('\n')
-                    
-                    # Handle continuation lines (starting with space)
-                    if line.startswith(' '):
-                        if current_key:
-                            current_value += line.strip()
-                        continue
-                    
-                    # Process previous key-value pair
-                    if current_key:
-                        info[current_key] = current_value
-                        current_key = None
-                        current_value = ""
-                    
-                    # Parse new key-value pair
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        current_key = key.strip()
-                        current_value = value.strip()
-                
-                # Add last key-value pair
-                if current_key:
-                    info[current_key] = current_value
+            with open(manifest_path, 'rb') as f:
+                info = parse_manifest(f.read())
             
             # Format certain fields
             if 'Build-Date' in info:
+                from datetime import datetime
+                
                 try:
                     build_date = datetime.strptime(info['Build-Date'], '%Y-%m-%dT%H:%M:%SZ')
                     info['Build-Date-Formatted'] = build_date.strftime('%Y-%m-%d %H:%M:%S UTC')
-                except:
+                except ValueError:
                     pass
             
             return info
             
-        except Exception as e:
-            print(f"Error parsing MANIFEST.MF: {e}")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Error parsing MANIFEST.MF: %s", e)
             return None
     
     def extract_maven_info(self) -> Dict[str, Any]:
@@ -117,83 +137,67 @@ class MetadataParser:
         Returns:
             Dictionary with Maven project information
         """
-        pom_path = os.path.join(self.meta_inf_dir, 'maven')
+        pom_path = self.maven_dir
         
         if not os.path.exists(pom_path):
             return {}
             
-        # Find pom.xml in subdirectories
-        pom_files = []
-        for root, _, files in os.walk(pom_path):
-            for file in files:
-                if file == 'pom.xml':
-                    pom_files.append(os.path.join(root, file))
+        # Find the first pom.xml in subdirectories (the directory itself is
+        # escaped so characters like [ ] in it are not read as a pattern)
+        pom_file = next(iglob(os.path.join(escape(pom_path), '**', 'pom.xml'), recursive=True), None)
         
-        if not pom_files:
+        if pom_file is None:
             return {}
             
         # Parse the first pom.xml found
         try:
-            tree = ET.parse(pom_files[0])
-            root = tree.getroot()
-            
-            # Extract namespace
-            ns_match = re.match(r'{(.*)}', root.tag)
-            ns = ns_match.group(1) if ns_match else ''
-            
-            # Function to find element with namespace
-            def find_elem(parent, tag):
-                if ns:
-                    return parent.find(f'{{{ns}}}{tag}')
-                else:
-                    return parent.find(tag)
-            
-            # Extract basic info
-            info = {}
-            
-            # Project coordinates
-            group_id = find_elem(root, 'groupId')
-            artifact_id = find_elem(root, 'artifactId')
-            version = find_elem(root, 'version')
+            # Stream the POM and only keep the project-level elements we read
+            found = {}
+            parent = {}
+            root = None
+            prefix = ''
+            depth = 0
             
-            if group_id is not None:
-                info['groupId'] = group_id.text
-            if artifact_id is not None:
-                info['artifactId'] = artifact_id.text
-            if version is not None:
-                info['version'] = version.text
+            for event, elem in ET.iterparse(pom_file, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        # Extract namespace
+                        root = elem
+                        ns_match = re.match(r'{(.*)}', root.tag)
+                        ns = ns_match.group(1) if ns_match else ''
+                        prefix = f'{{{ns}}}' if ns else ''
+                    depth += 1
+                    continue
                 
-            # Project metadata
-            name = find_elem(root, 'name')
-            description = find_elem(root, 'description')
-            
-            if name is not None:
-                info['name'] = name.text
-            if description is not None:
-                info['description'] = description.text
+                depth -= 1
+                if depth != 1:
+                    continue
                 
-            # Extract parent info
-            parent_elem = find_elem(root, 'parent')
-            if parent_elem is not None:
-                parent = {}
-                parent_group_id = find_elem(parent_elem, 'groupId')
-                parent_artifact_id = find_elem(parent_elem, 'artifactId')
-                parent_version = find_elem(parent_elem, 'version')
+                tag = elem.tag[len(prefix):] if elem.tag.startswith(prefix) else None
+                if tag in ('groupId', 'artifactId', 'version', 'name', 'description'):
+                    found[tag] = elem.text
+                elif tag == 'parent':
+                    for child_tag in ('groupId', 'artifactId', 'version'):
+                        child = elem.find(prefix + child_tag)
+                        if child is not None:
+                            parent[child_tag] = child.text
                 
-                if parent_group_id is not None:
-                    parent['groupId'] = parent_group_id.text
-                if parent_artifact_id is not None:
-                    parent['artifactId'] = parent_artifact_id.text
-                if parent_version is not None:
-                    parent['version'] = parent_version.text
+                # Drop processed project-level elements to keep memory flat
+                root.clear()
+            
+            # Extract basic info, keeping the project coordinates first
+            info = {}
+            for tag in ('groupId', 'artifactId', 'version', 'name', 'description'):
+                if tag in found:
+                    info[tag] = found[tag]
                     
-                if parent:
-                    info['parent'] = parent
+            if parent:
+                info['parent'] = parent
             
             return info
             
-        except Exception as e:
-            print(f"Error parsing pom.xml: {e}")
+        except (OSError, ET.ParseError) as e:
+            logger.warning("Error parsing pom.xml: %s", e)
             return {}
     
     def extract_mule_info(self) -> Dict[str, Any]:
@@ -212,8 +216,8 @@ class MetadataParser:
                 with open(plugin_path, 'r', encoding='utf-8') as f:
                     plugin_info = json.load(f)
                 mule_info['plugin'] = plugin_info
-            except Exception as e:
-                print(f"Error parsing mule-plugin.json: {e}")
+            except (OSError, ValueError) as e:
+                logger.warning("Error parsing mule-plugin.json: %s", e)
         
         return mule_info
     
@@ -232,6 +236,11 @@ class MetadataParser:
         try:
             with open(artifact_path, 'r', encoding='utf-8') as f:
                 artifact_info = json.load(f)
+            
+            # Valid JSON whose root is not an object carries no artifact fields
+            if not isinstance(artifact_info, dict):
+                logger.warning("Ignoring mule-artifact.json: root is not a JSON object")
+                return {}
                 
             # Format and clean up information
             result = {}
@@ -247,12 +256,12 @@ class MetadataParser:
                 
             if 'classLoaderModelLoaderDescriptor' in artifact_info:
                 descriptor = artifact_info['classLoaderModelLoaderDescriptor']
-                if 'id' in descriptor:
+                if isinstance(descriptor, dict) and 'id' in descriptor:
                     result['classLoaderType'] = descriptor['id']
                     
             if 'bundleDescriptorLoader' in artifact_info:
                 descriptor = artifact_info['bundleDescriptorLoader']
-                if 'id' in descriptor:
+                if isinstance(descriptor, dict) and 'id' in descriptor:
                     result['bundleType'] = descriptor['id']
                     
             # Include configs if available
@@ -265,8 +274,8 @@ class MetadataParser:
                 
             return result
             
-        except Exception as e:
-            print(f"Error parsing mule-artifact.json: {e}")
+        except (OSError, ValueError) as e:
+            logger.warning("Error parsing mule-artifact.json: %s", e)
             return {}
     
     def extract_build_info(self) -> Dict[str, Any]:
@@ -280,16 +289,11 @@ class MetadataParser:
         properties_path = os.path.join(self.meta_inf_dir, 'build.properties')
         if os.path.exists(properties_path):
             try:
-                properties = {}
                 with open(properties_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            key, value = line.split('=', 1)
-                            properties[key.strip()] = value.strip()
+                    properties = dict(iter_properties(f.read()))
                 return properties
-            except Exception as e:
-                print(f"Error parsing build.properties: {e}")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning("Error parsing build.properties: %s", e)
         
         return {}
     
@@ -303,39 +307,35 @@ class MetadataParser:
         dependencies = []
         
         # Try to find maven dependencies
-        pom_properties_dir = os.path.join(self.meta_inf_dir, 'maven')
+        pom_properties_dir = self.maven_dir
         
         if not os.path.exists(pom_properties_dir):
             return dependencies
             
+        # Bind names used on every iteration; shaded JARs can hold hundreds of entries
+        read_properties = iter_properties
+        add_dependency = dependencies.append
+        
         # Find all pom.properties files
-        for root, _, files in os.walk(pom_properties_dir):
-            for file in files:
-                if file == 'pom.properties':
-                    prop_path = os.path.join(root, file)
-                    try:
-                        # Read properties file
-                        props = {}
-                        with open(prop_path, 'r', encoding='utf-8') as f:
-                            for line in f:
-                                line = line.strip()
-                                if line and not line.startswith('#'):
-                                    key, value = line.split('=', 1)
-                                    props[key.strip()] = value.strip()
+        for prop_path in iglob(os.path.join(escape(pom_properties_dir), '**', 'pom.properties'), recursive=True):
+            try:
+                # Read properties file
+                with open(prop_path, 'r', encoding='utf-8') as f:
+                    props = dict(read_properties(f.read()))
+                
+                # Extract dependency info
+                if 'groupId' in props and 'artifactId' in props:
+                    dep = {
+                        'groupId': props['groupId'],
+                        'artifactId': props['artifactId']
+                    }
+                    
+                    if 'version' in props:
+                        dep['version'] = props['version']
                         
-                        # Extract dependency info
-                        if 'groupId' in props and 'artifactId' in props:
-                            dep = {
-                                'groupId': props['groupId'],
-                                'artifactId': props['artifactId']
-                            }
-                            
-                            if 'version' in props:
-                                dep['version'] = props['version']
-                                
-                            dependencies.append(dep)
-                    except Exception as e:
-                        print(f"Error parsing {prop_path}: {e}")
+                    add_dependency(dep)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning("Error parsing %s: %s", prop_path, e)
         
         return dependencies
 
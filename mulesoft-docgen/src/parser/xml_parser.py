@@ -4,14 +4,23 @@ This module extracts information about flows, connectors, and transformations fr
 """
 
 import os
+import sys
+import functools
+import hashlib
+import json
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from lxml import etree
-import traceback
 
-from ..model.interface import Interface, Flow
+from ..model.interface import Interface, Flow, Processor
 from .dataweave_parser import DataWeaveParser
 
+logger = logging.getLogger(__name__)
+
 # MuleSoft XML namespaces
 NAMESPACES = {
     'mule': 'http://www.mulesoft.org/schema/mule/core',
@@ -26,6 +35,429 @@ NAMESPACES = {
     'batch': 'http://www.mulesoft.org/schema/mule/batch'
 }
 
+# Reverse lookup from namespace URI to its prefix
+_NS_BY_URI = {uri: prefix for prefix, uri in NAMESPACES.items()}
+
+# Number of files handed to a worker process at a time by parse_directory
+PARSE_CHUNK_SIZE = 8
+
+# Optional on-disk cache of parsed flows, keyed by file path, mtime, size and
+# the parser code itself. Off unless MULE_DOCGEN_CACHE=1 (main.py --cache);
+# MULE_DOCGEN_CACHE_DIR overrides the per-user cache location.
+CACHE_ENV_VAR = 'MULE_DOCGEN_CACHE'
+CACHE_DIR_ENV_VAR = 'MULE_DOCGEN_CACHE_DIR'
+_CACHE_VERSION = 2
+
+# Modules whose code decides what a cached entry contains
+_CACHE_CODE_FILES = (
+    __file__,
+    os.path.join(os.path.dirname(__file__), 'dataweave_parser.py'),
+    os.path.join(os.path.dirname(__file__), os.pardir, 'model', 'interface.py')
+)
+
+# Parser options: drop whitespace-only text, comments and processing
+# instructions so the trees we walk only hold Mule elements
+_PARSER_OPTIONS = {
+    'remove_blank_text': True,
+    'remove_comments': True,
+    'remove_pis': True,
+    'collect_ids': False,
+    'huge_tree': False
+}
+
+# Shared parser used for full-tree parsing
+_PARSER = etree.XMLParser(**_PARSER_OPTIONS)
+
+# Clark-notation tags for elements collected in a single tree walk
+_FLOW_TAG = f"{{{NAMESPACES['mule']}}}flow"
+_SUBFLOW_TAG = f"{{{NAMESPACES['mule']}}}sub-flow"
+_FILE_CONFIG_TAG = f"{{{NAMESPACES['file']}}}config"
+_SFTP_CONFIG_TAG = f"{{{NAMESPACES['sftp']}}}config"
+_HTTP_LISTENER_CONFIG_TAG = f"{{{NAMESPACES['http']}}}listener-config"
+
+# Clark-notation tags for single-element find() lookups
+_DESC_TAG = f"{{{NAMESPACES['doc']}}}description"
+_SFTP_CONN_TAG = f"{{{NAMESPACES['sftp']}}}connection"
+_HTTP_LISTENER_CONN_TAG = f"{{{NAMESPACES['http']}}}listener-connection"
+
+# Clark-notation tags for DataWeave elements scanned in parse_xml_files
+_EE_TRANSFORM_TAG = f"{{{NAMESPACES['ee']}}}transform"
+_DW_TRANSFORM_TAG = f"{{{NAMESPACES['dw']}}}transform"
+_EE_SET_PAYLOAD_TAG = f"{{{NAMESPACES['ee']}}}set-payload"
+_DW_SET_PAYLOAD_TAG = f"{{{NAMESPACES['dw']}}}set-payload"
+
+# Clark-notation tags for global configuration elements read by parse_xml_files
+_CONFIGURATION_TAG = f"{{{NAMESPACES['mule']}}}configuration"
+_PROPERTY_TAG = f"{{{NAMESPACES['mule']}}}property"
+
+# Pre-compiled XPath expressions, so each query is parsed only once
+_XP_SOURCE_UNION = etree.XPath('./file:listener|./sftp:listener|./http:listener|./mule:scheduler',
+                               namespaces=NAMESPACES)
+_XP_DW_SET_PAYLOAD = etree.XPath('.//dw:set-payload', namespaces=NAMESPACES)
+_XP_WHEN = etree.XPath('./mule:when', namespaces=NAMESPACES)
+_XP_OTHERWISE = etree.XPath('./mule:otherwise', namespaces=NAMESPACES)
+
+def _split_tag(element) -> Tuple[str, str]:
+    """
+    Split an element tag into its namespace prefix and local name.
+    
+    Args:
+        element: The XML element
+        
+    Returns:
+        Tuple of (prefix, local name); the prefix is empty for unknown
+        namespaces and the local name is 'unknown' for non-namespaced tags
+    """
+    tag = element.tag
+    if isinstance(tag, str) and tag[:1] == '{':
+        qname = etree.QName(tag)
+        return _NS_BY_URI.get(qname.namespace, ''), qname.localname
+    return '', 'unknown'
+
+def _handle_file_listener(source) -> Dict[str, Any]:
+    """Build source information for a file:listener element."""
+    return {
+        'type': 'file-listener',
+        'directory': source.get('directory', 'Not specified'),
+        'pattern': source.get('matcher', 'Not specified')
+    }
+
+def _handle_sftp_listener(source) -> Dict[str, Any]:
+    """Build source information for an sftp:listener element."""
+    return {
+        'type': 'sftp-listener',
+        'directory': source.get('directory', 'Not specified'),
+        'pattern': source.get('matcher', 'Not specified')
+    }
+
+def _handle_http_listener(source) -> Dict[str, Any]:
+    """Build source information for an http:listener element."""
+    return {
+        'type': 'http-listener',
+        'path': source.get('path', 'Not specified'),
+        'method': source.get('method', 'All methods')
+    }
+
+def _handle_scheduler(source) -> Dict[str, Any]:
+    """Build source information for a scheduler element."""
+    return {
+        'type': 'scheduler',
+        'frequency': source.get('frequency', 'Not specified')
+    }
+
+# (local name, namespace prefix) of a source element -> source info builder
+_SOURCE_HANDLERS = {
+    ('listener', 'file'): _handle_file_listener,
+    ('listener', 'sftp'): _handle_sftp_listener,
+    ('listener', 'http'): _handle_http_listener,
+    ('scheduler', 'mule'): _handle_scheduler
+}
+
+def _extract_source(flow_element) -> Optional[Dict[str, Any]]:
+    """
+    Extract the source (trigger) of a flow.
+    
+    Args:
+        flow_element: The flow XML element
+        
+    Returns:
+        Dictionary with source information or None if no source found
+    """
+    # Common triggers/sources in MuleSoft (file and SFTP connectors, HTTP
+    # listeners, schedulers), matched by a single union query. Take the
+    # first one (usually there's only one)
+    source = next(iter(_XP_SOURCE_UNION(flow_element)), None)
+    
+    if source is None:
+        return None
+    
+    prefix, tag = _split_tag(source)
+    
+    handler = _SOURCE_HANDLERS.get((tag, prefix))
+    if handler:
+        return handler(source)
+    
+    # Generic source information
+    return {
+        'type': tag,
+        'attributes': dict(source.attrib)
+    }
+
+def _extract_processors(flow_element) -> List[Processor]:
+    """
+    Extract all processors (components) from a flow.
+    
+    Args:
+        flow_element: The flow or sub-flow XML element
+        
+    Returns:
+        List of Processor objects
+    """
+    processors = []
+    
+    # Walk the children lazily, peeking at the leading ones only
+    children = iter(flow_element)
+    child = next(children, None)
+    
+    # Skip the first child if it's a source in a flow (not in sub-flows)
+    if child is not None and flow_element.tag == _FLOW_TAG and child.tag != _DESC_TAG:
+        child = next(children, None)
+    
+    # Skip documentation elements
+    if child is not None and child.tag == _DESC_TAG:
+        child = next(children, None)
+    
+    if child is not None:
+        children = chain((child,), children)
+    
+    for child in children:
+        _, tag = _split_tag(child)
+        
+        # Basic processor info
+        processor = Processor(tag, dict(child.attrib))
+        
+        # Special handling for certain processor types
+        if tag == 'transform':
+            # Handle DataWeave transformations
+            dw_elements = _XP_DW_SET_PAYLOAD(child)
+            if dw_elements:
+                code = dw_elements[0].get('resource') or dw_elements[0].text or 'No transformation code found'
+                processor.transformation = {
+                    'type': 'dw-set-payload',
+                    'code': code
+                }
+        elif tag in ['file:write', 'sftp:write']:
+            # Handle file write operations
+            processor.file_operation = {
+                'path': child.get('path', 'Not specified'),
+                'mode': child.get('mode', 'Overwrite')
+            }
+        elif tag == 'choice':
+            # Handle choice routers
+            when_elements = _XP_WHEN(child)
+            processor.routes = []
+            
+            for when in when_elements:
+                expression = when.get('expression', 'No condition')
+                # Extract the processors inside this when route
+                route_processors = _extract_processors(when)
+                processor.routes.append({
+                    'condition': expression,
+                    'processors': route_processors
+                })
+            
+            # Handle the default route (otherwise)
+            otherwise = _XP_OTHERWISE(child)
+            if otherwise:
+                route_processors = _extract_processors(otherwise[0])
+                processor.routes.append({
+                    'condition': 'otherwise',
+                    'processors': route_processors
+                })
+        
+        processors.append(processor)
+    
+    return processors
+
+def _flow_info(flow_element) -> Dict[str, Any]:
+    """
+    Build the information dictionary for a flow.
+    
+    Args:
+        flow_element: The flow XML element
+        
+    Returns:
+        Dictionary with flow information
+    """
+    flow_id = flow_element.get('name', 'Unknown')
+    
+    # Get flow documentation if available
+    doc = flow_element.find(_DESC_TAG)
+    description = doc.text if doc is not None and doc.text else f"Flow: {flow_id}"
+    
+    return {
+        'id': flow_id,
+        'description': description,
+        'source': _extract_source(flow_element),
+        'processors': _extract_processors(flow_element),
+        'type': 'flow'
+    }
+
+def _subflow_info(subflow_element) -> Dict[str, Any]:
+    """
+    Build the information dictionary for a sub-flow.
+    
+    Args:
+        subflow_element: The sub-flow XML element
+        
+    Returns:
+        Dictionary with sub-flow information
+    """
+    subflow_id = subflow_element.get('name', 'Unknown')
+    
+    # Get subflow documentation if available
+    doc = subflow_element.find(_DESC_TAG)
+    description = doc.text if doc is not None and doc.text else f"Sub-flow: {subflow_id}"
+    
+    return {
+        'id': subflow_id,
+        'description': description,
+        'source': None,  # Sub-flows don't have sources
+        'processors': _extract_processors(subflow_element),
+        'type': 'sub-flow'
+    }
+
+def _file_config_info(config) -> Dict[str, Any]:
+    """Build the information dictionary for a file:config element."""
+    attrs = config.attrib
+    return {
+        'name': attrs.get('name', 'Unknown'),
+        'working-directory': attrs.get('workingDirectory', 'Not specified')
+    }
+
+def _sftp_config_info(config) -> Dict[str, Any]:
+    """Build the information dictionary for an sftp:config element."""
+    connection = config.find(f'.//{_SFTP_CONN_TAG}')
+    conn_details = {}
+    if connection is not None:
+        conn_attrs = connection.attrib
+        conn_details = {
+            'host': conn_attrs.get('host', 'Not specified'),
+            'port': conn_attrs.get('port', '22'),
+            'username': conn_attrs.get('username', 'Not specified')
+        }
+    
+    return {
+        'name': config.get('name', 'Unknown'),
+        'connection': conn_details
+    }
+
+def _http_config_info(config) -> Dict[str, Any]:
+    """Build the information dictionary for an http:listener-config element."""
+    connection = config.find(f'.//{_HTTP_LISTENER_CONN_TAG}')
+    conn_details = {}
+    if connection is not None:
+        conn_attrs = connection.attrib
+        conn_details = {
+            'host': conn_attrs.get('host', 'Not specified'),
+            'port': conn_attrs.get('port', '8081')
+        }
+    
+    attrs = config.attrib
+    return {
+        'name': attrs.get('name', 'Unknown'),
+        'base-path': attrs.get('basePath', '/'),
+        'connection': conn_details
+    }
+
+# Global config element tag -> (output key, builder), in output key order
+_CONFIG_BUILDERS = {
+    _FILE_CONFIG_TAG: ('file', _file_config_info),
+    _SFTP_CONFIG_TAG: ('sftp', _sftp_config_info),
+    _HTTP_LISTENER_CONFIG_TAG: ('http', _http_config_info)
+}
+
+def _order_configs(configs: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Order collected global configurations by config kind.
+    
+    Args:
+        configs: Dictionary mapping config kind to its collected entries
+        
+    Returns:
+        Dictionary with the same entries, keyed in _CONFIG_BUILDERS order
+    """
+    return {kind: configs[kind] for kind, _ in _CONFIG_BUILDERS.values() if kind in configs}
+
+def _cache_enabled() -> bool:
+    """
+    Check whether the on-disk flow cache was switched on.
+    
+    Returns:
+        True when MULE_DOCGEN_CACHE is set to 1
+    """
+    return os.environ.get(CACHE_ENV_VAR) == '1'
+
+def _cache_dir() -> str:
+    """
+    Get the per-user directory that holds the flow cache.
+    
+    Returns:
+        MULE_DOCGEN_CACHE_DIR when set, otherwise a mulesoft-docgen directory
+        in the platform's user cache location
+    """
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return override
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'mulesoft-docgen')
+
+@functools.lru_cache(maxsize=None)
+def _code_version() -> str:
+    """
+    Fingerprint the parser code so entries written by other versions are never used.
+    
+    Returns:
+        Hex digest over the cache format version and the parser source files
+    """
+    digest = hashlib.sha1(str(_CACHE_VERSION).encode('ascii'))
+    for path in _CACHE_CODE_FILES:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _cached_flows(xml_file_path: str, extract) -> List[Dict[str, Any]]:
+    """
+    Get the flows of an XML file, reusing the on-disk cache when it is enabled
+    and the file is unchanged.
+    
+    Each entry starts with a JSON header line holding its key; the pickled
+    flows after it are only loaded when that header matches.
+    
+    Args:
+        xml_file_path: Path to the MuleSoft XML file
+        extract: Callable taking the file path and returning its flows,
+            used on a cache miss
+        
+    Returns:
+        List of dictionaries with flow information
+    """
+    if not _cache_enabled():
+        return extract(xml_file_path)
+    
+    abs_path = os.path.abspath(xml_file_path)
+    stat = os.stat(abs_path)
+    key = [_code_version(), abs_path, stat.st_mtime_ns, stat.st_size]
+    cache_dir = _cache_dir()
+    cache_path = os.path.join(cache_dir, hashlib.sha1(abs_path.encode('utf-8')).hexdigest() + '.pickle')
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            if json.loads(f.readline()) == key:
+                return pickle.load(f)
+    except Exception:
+        # Missing, stale or unreadable entry: parse the file again
+        pass
+    
+    flows = extract(xml_file_path)
+    
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        # Write to a private temp file first so concurrent workers never see partial entries
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(key).encode('utf-8') + b'\n')
+            pickle.dump(flows, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best effort, e.g. on a read-only home directory
+        pass
+    
+    return flows
+
 class XmlParser:
     """Parser for MuleSoft XML configuration files."""
     
@@ -41,11 +473,10 @@ class XmlParser:
             xml_file_path: Path to the MuleSoft XML file
         """
         try:
-            # Create a parser instance for this specific file
-            parser = self._create_file_parser(xml_file_path)
+            # Extract flows with a parser for this specific file (or from the cache)
+            flows = _cached_flows(xml_file_path, lambda path: self._create_file_parser(path).get_flows())
             
-            # Extract flows and add them to our collection
-            flows = parser.get_flows()
+            # Add them to our collection
             self.flows.extend(flows)
         except Exception as e:
             print(f"Error parsing XML file {xml_file_path}: {e}")
@@ -75,27 +506,75 @@ class XmlParser:
 class MuleFileXmlParser:
     """Parser for a single MuleSoft XML configuration file."""
     
-    def __init__(self, xml_file_path: str):
+    def __init__(self, xml_file_path: str, load_tree: bool = True):
         """
         Initialize the parser with a MuleSoft XML file path.
         
         Args:
             xml_file_path: Path to the MuleSoft XML file
+            load_tree: Parse the full tree up front; pass False when only
+                parse_stream() will be used
         """
         self.xml_file_path = xml_file_path
         self.tree = None
         self.root = None
-        self.parse()
+        if load_tree:
+            self.parse()
     
     def parse(self) -> None:
         """Parse the XML file and set up the tree and root elements."""
         try:
-            self.tree = etree.parse(self.xml_file_path)
+            self.tree = etree.parse(self.xml_file_path, _PARSER)
             self.root = self.tree.getroot()
         except Exception as e:
             print(f"Error parsing XML file {self.xml_file_path}: {e}")
             raise
     
+    def parse_stream(self) -> Dict[str, Any]:
+        """
+        Stream the XML file and extract its flows and global configurations.
+        
+        The full tree is never held in memory: each flow, sub-flow and config
+        element is processed as soon as its end tag is read, then cleared
+        together with the siblings already handled before it.
+        
+        Returns:
+            Dictionary with 'flows' and 'global_configs', shaped like the
+            results of get_flows() and get_global_configs()
+        """
+        flows = []
+        subflows = []
+        configs = {}
+        
+        try:
+            context = etree.iterparse(self.xml_file_path, events=('end',),
+                                      tag=(_FLOW_TAG, _SUBFLOW_TAG, *_CONFIG_BUILDERS),
+                                      **_PARSER_OPTIONS)
+            for _, elem in context:
+                if elem.tag == _FLOW_TAG:
+                    flows.append(_flow_info(elem))
+                elif elem.tag == _SUBFLOW_TAG:
+                    subflows.append(_subflow_info(elem))
+                else:
+                    kind, build = _CONFIG_BUILDERS[elem.tag]
+                    configs.setdefault(kind, []).append(build(elem))
+                
+                # Release the processed subtree and earlier siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except Exception as e:
+            print(f"Error parsing XML file {self.xml_file_path}: {e}")
+            raise
+        
+        # Sub-flows are listed after all flows
+        flows.extend(subflows)
+        
+        return {
+            'flows': flows,
+            'global_configs': _order_configs(configs)
+        }
+    
     def get_flows(self) -> List[Dict[str, Any]]:
         """
         Extract all flows from the XML file.
@@ -104,50 +583,17 @@ class MuleFileXmlParser:
             List of dictionaries with flow information
         """
         flows = []
+        subflows = []
         
-        # Find all flow elements
-        flow_elements = self.root.xpath('//mule:flow', namespaces=NAMESPACES)
+        # Process flows and sub-flows in one walk over the tree
+        for _, elem in etree.iterwalk(self.root, events=('start',), tag=(_FLOW_TAG, _SUBFLOW_TAG)):
+            if elem.tag == _FLOW_TAG:
+                flows.append(_flow_info(elem))
+            else:
+                subflows.append(_subflow_info(elem))
         
-        for flow in flow_elements:
-            flow_id = flow.get('name', 'Unknown')
-            
-            # Get flow documentation if available
-            doc = flow.xpath('./doc:description', namespaces=NAMESPACES)
-            description = doc[0].text if doc and doc[0].text else f"Flow: {flow_id}"
-            
-            # Extract source information (triggers/listeners)
-            source = self._extract_source(flow)
-            
-            # Extract processors (components in the flow)
-            processors = self._extract_processors(flow)
-            
-            flows.append({
-                'id': flow_id,
-                'description': description,
-                'source': source,
-                'processors': processors,
-                'type': 'flow'
-            })
-        
-        # Also get sub-flows
-        subflow_elements = self.root.xpath('//mule:sub-flow', namespaces=NAMESPACES)
-        for subflow in subflow_elements:
-            subflow_id = subflow.get('name', 'Unknown')
-            
-            # Get subflow documentation if available
-            doc = subflow.xpath('./doc:description', namespaces=NAMESPACES)
-            description = doc[0].text if doc and doc[0].text else f"Sub-flow: {subflow_id}"
-            
-            # Extract processors
-            processors = self._extract_processors(subflow)
-            
-            flows.append({
-                'id': subflow_id,
-                'description': description,
-                'source': None,  # Sub-flows don't have sources
-                'processors': processors,
-                'type': 'sub-flow'
-            })
+        # Sub-flows are listed after all flows
+        flows.extend(subflows)
         
         return flows
     
@@ -161,73 +607,9 @@ class MuleFileXmlParser:
         Returns:
             Dictionary with source information or None if no source found
         """
-        # Common triggers/sources in MuleSoft
-        source_elements = []
-        
-        # File connectors
-        source_elements.extend(flow_element.xpath('./file:listener', namespaces=NAMESPACES))
-        source_elements.extend(flow_element.xpath('./sftp:listener', namespaces=NAMESPACES))
-        
-        # HTTP listeners
-        source_elements.extend(flow_element.xpath('./http:listener', namespaces=NAMESPACES))
-        
-        # Schedulers
-        source_elements.extend(flow_element.xpath('./mule:scheduler', namespaces=NAMESPACES))
-        
-        if not source_elements:
-            return None
-        
-        # Take the first source element (usually there's only one)
-        source = source_elements[0]
-        
-        # Safe way to extract tag name and namespace
-        if hasattr(source, 'tag'):
-            if isinstance(source.tag, str) and '}' in source.tag:
-                # Extract namespace and local name from tag string
-                ns, tag = source.tag.rsplit('}', 1)
-                ns = ns.strip('{')
-            else:
-                # Fallback for non-string or non-namespace tags
-                tag = 'unknown'
-                ns = ''
-        else:
-            # Fallback for elements without tag attribute
-            tag = 'unknown'
-            ns = ''
-        
-        if tag == 'listener':
-            # File or SFTP listener
-            if 'file' in ns:
-                return {
-                    'type': 'file-listener',
-                    'directory': source.get('directory', 'Not specified'),
-                    'pattern': source.get('matcher', 'Not specified')
-                }
-            elif 'sftp' in ns:
-                return {
-                    'type': 'sftp-listener',
-                    'directory': source.get('directory', 'Not specified'),
-                    'pattern': source.get('matcher', 'Not specified')
-                }
-            elif 'http' in ns:
-                return {
-                    'type': 'http-listener',
-                    'path': source.get('path', 'Not specified'),
-                    'method': source.get('method', 'All methods')
-                }
-        elif tag == 'scheduler':
-            return {
-                'type': 'scheduler',
-                'frequency': source.get('frequency', 'Not specified')
-            }
-        
-        # Generic source information
-        return {
-            'type': tag,
-            'attributes': {key: source.get(key) for key in source.keys()}
-        }
+        return _extract_source(flow_element)
     
-    def _extract_processors(self, flow_element) -> List[Dict[str, Any]]:
+    def _extract_processors(self, flow_element) -> List[Processor]:
         """
         Extract all processors (components) from a flow.
         
@@ -235,80 +617,9 @@ class MuleFileXmlParser:
             flow_element: The flow or sub-flow XML element
             
         Returns:
-            List of dictionaries with processor information
+            List of Processor objects
         """
-        processors = []
-        
-        # Skip the first child if it's a source in a flow (not in sub-flows)
-        children = list(flow_element)
-        start_idx = 1 if (flow_element.tag.endswith('flow') and len(children) > 0 and 
-                          not (children[0].tag.endswith('description'))) else 0
-        
-        # Skip documentation elements
-        if start_idx < len(children) and children[start_idx].tag.endswith('description'):
-            start_idx += 1
-        
-        for child in children[start_idx:]:
-            # Safe way to extract tag name
-            if hasattr(child, 'tag'):
-                if isinstance(child.tag, str) and '}' in child.tag:
-                    # Extract namespace and local name from tag string
-                    _, tag = child.tag.rsplit('}', 1)
-                else:
-                    # Fallback for non-string or non-namespace tags
-                    tag = 'unknown'
-            else:
-                # Fallback for elements without tag attribute
-                tag = 'unknown'
-            
-            # Basic processor info
-            processor = {
-                'type': tag,
-                'attributes': {key: child.get(key) for key in child.keys()}
-            }
-            
-            # Special handling for certain processor types
-            if tag == 'transform':
-                # Handle DataWeave transformations
-                dw_elements = child.xpath('.//dw:set-payload', namespaces=NAMESPACES)
-                if dw_elements:
-                    code = dw_elements[0].get('resource') or dw_elements[0].text or 'No transformation code found'
-                    processor['transformation'] = {
-                        'type': 'dw-set-payload',
-                        'code': code
-                    }
-            elif tag in ['file:write', 'sftp:write']:
-                # Handle file write operations
-                processor['file_operation'] = {
-                    'path': child.get('path', 'Not specified'),
-                    'mode': child.get('mode', 'Overwrite')
-                }
-            elif tag == 'choice':
-                # Handle choice routers
-                when_elements = child.xpath('./mule:when', namespaces=NAMESPACES)
-                processor['routes'] = []
-                
-                for when in when_elements:
-                    expression = when.get('expression', 'No condition')
-                    # Extract the processors inside this when route
-                    route_processors = self._extract_processors(when)
-                    processor['routes'].append({
-                        'condition': expression,
-                        'processors': route_processors
-                    })
-                
-                # Handle the default route (otherwise)
-                otherwise = child.xpath('./mule:otherwise', namespaces=NAMESPACES)
-                if otherwise:
-                    route_processors = self._extract_processors(otherwise[0])
-                    processor['routes'].append({
-                        'condition': 'otherwise',
-                        'processors': route_processors
-                    })
-            
-            processors.append(processor)
-        
-        return processors
+        return _extract_processors(flow_element)
     
     def get_global_configs(self) -> Dict[str, Any]:
         """
@@ -319,73 +630,50 @@ class MuleFileXmlParser:
         """
         configs = {}
         
-        # Extract file configurations
-        file_configs = self.root.xpath('//file:config', namespaces=NAMESPACES)
-        if file_configs:
-            configs['file'] = []
-            for config in file_configs:
-                configs['file'].append({
-                    'name': config.get('name', 'Unknown'),
-                    'working-directory': config.get('workingDirectory', 'Not specified')
-                })
+        # Collect all supported config elements in one walk over the tree
+        for elem in self.root.iter(*_CONFIG_BUILDERS):
+            kind, build = _CONFIG_BUILDERS[elem.tag]
+            configs.setdefault(kind, []).append(build(elem))
         
-        # Extract SFTP configurations
-        sftp_configs = self.root.xpath('//sftp:config', namespaces=NAMESPACES)
-        if sftp_configs:
-            configs['sftp'] = []
-            for config in sftp_configs:
-                connection = config.find('.//sftp:connection', namespaces=NAMESPACES)
-                conn_details = {}
-                if connection is not None:
-                    conn_details = {
-                        'host': connection.get('host', 'Not specified'),
-                        'port': connection.get('port', '22'),
-                        'username': connection.get('username', 'Not specified')
-                    }
-                
-                configs['sftp'].append({
-                    'name': config.get('name', 'Unknown'),
-                    'connection': conn_details
-                })
-        
-        # Extract HTTP configurations
-        http_configs = self.root.xpath('//http:listener-config', namespaces=NAMESPACES)
-        if http_configs:
-            configs['http'] = []
-            for config in http_configs:
-                connection = config.find('.//http:listener-connection', namespaces=NAMESPACES)
-                conn_details = {}
-                if connection is not None:
-                    conn_details = {
-                        'host': connection.get('host', 'Not specified'),
-                        'port': connection.get('port', '8081')
-                    }
-                
-                configs['http'].append({
-                    'name': config.get('name', 'Unknown'),
-                    'base-path': config.get('basePath', '/'),
-                    'connection': conn_details
-                })
+        return _order_configs(configs)
+
+def _parse_one(xml_file_path: str) -> List[Dict[str, Any]]:
+    """
+    Parse a single MuleSoft XML file and return its flows.
+    
+    Kept at module level so it can be sent to worker processes.
+    
+    Args:
+        xml_file_path: Path to the MuleSoft XML file
         
-        return configs
+    Returns:
+        List of dictionaries with flow information
+    """
+    return _cached_flows(xml_file_path, lambda path: MuleFileXmlParser(path).get_flows())
 
 def parse_directory(directory_path: str) -> Dict[str, Any]:
     """
     Parse all XML files in a directory.
     
+    Files are parsed in parallel worker processes when there is more than one.
+    
     Args:
         directory_path: Path to the directory containing XML files
         
     Returns:
         Dictionary with parsed information
     """
-    parser = XmlParser()
+    files = [str(file_path) for file_path in Path(directory_path).glob('**/*.xml')]
     
-    for file_path in Path(directory_path).glob('**/*.xml'):
-        parser.parse_file(str(file_path))
+    if len(files) < 2:
+        flows = [flow for xml_file in files for flow in _parse_one(xml_file)]
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_parse_one, files, chunksize=PARSE_CHUNK_SIZE)
+            flows = list(chain.from_iterable(results))
     
     return {
-        'flows': parser.get_flows()
+        'flows': flows
     }
 
 def parse_xml_files(xml_files: List[str], interface_name: str = "MuleSoft Interface") -> Interface:
@@ -404,30 +692,22 @@ def parse_xml_files(xml_files: List[str], interface_name: str = "MuleSoft Interf
     
     for xml_file in xml_files:
         try:
-            tree = etree.parse(xml_file)
+            tree = etree.parse(xml_file, _PARSER)
             root = tree.getroot()
             
-            # Define namespaces
-            namespaces = {
-                'mule': 'http://www.mulesoft.org/schema/mule/core',
-                'dw': 'http://www.mulesoft.org/schema/mule/ee/dw',
-                'ee': 'http://www.mulesoft.org/schema/mule/ee/core',
-            }
-            
             # Find flows
-            flow_elements = root.xpath('//mule:flow', namespaces=namespaces)
-            for flow_elem in flow_elements:
+            for flow_elem in root.iter(_FLOW_TAG):
                 flow_id = flow_elem.get('name', 'Unnamed Flow')
                 
                 # Get flow documentation if available
-                doc = flow_elem.xpath('./doc:description', namespaces=NAMESPACES)
-                description = doc[0].text if doc and doc[0].text else f"Flow: {flow_id}"
+                doc = flow_elem.find(_DESC_TAG)
+                description = doc.text if doc is not None and doc.text else f"Flow: {flow_id}"
                 
                 # Extract source information (triggers/listeners)
-                source = self._extract_source(flow_elem)
+                source = _extract_source(flow_elem)
                 
                 # Extract processors (components in the flow)
-                processors = self._extract_processors(flow_elem)
+                processors = _extract_processors(flow_elem)
                 
                 flow = Flow(
                     flow_id=flow_id,
@@ -438,17 +718,9 @@ def parse_xml_files(xml_files: List[str], interface_name: str = "MuleSoft Interf
                     file_name=os.path.basename(xml_file)
                 )
                 
-                # Find DataWeave transformations in the flow
-                dw_elements = []
-                
-                # Look for ee:transform elements
-                dw_elements.extend(flow_elem.xpath('.//ee:transform', namespaces=namespaces))
-                
-                # Look for dw:transform elements (older style)
-                dw_elements.extend(flow_elem.xpath('.//dw:transform', namespaces=namespaces))
-                
-                # Look for ee:set-payload with DataWeave code
-                dw_elements.extend(flow_elem.xpath('.//ee:set-payload', namespaces=namespaces))
+                # Find DataWeave transformations in the flow: ee:transform,
+                # dw:transform (older style) and ee:set-payload with DataWeave code
+                dw_elements = flow_elem.iter(_EE_TRANSFORM_TAG, _DW_TRANSFORM_TAG, _EE_SET_PAYLOAD_TAG)
                 
                 for dw_elem in dw_elements:
                     dw_code = None
@@ -456,17 +728,20 @@ def parse_xml_files(xml_files: List[str], interface_name: str = "MuleSoft Interf
                     # Try to find the DataWeave code
                     if dw_elem.tag.endswith('transform'):
                         # Look for dw:set-payload inside transform
-                        set_payload = dw_elem.xpath('.//dw:set-payload', namespaces=namespaces)
-                        if set_payload and set_payload[0].text:
-                            dw_code = set_payload[0].text
+                        set_payload = next(dw_elem.iter(_DW_SET_PAYLOAD_TAG), None)
+                        if set_payload is not None and set_payload.text:
+                            dw_code = set_payload.text
                         
                         # Look for ee:set-payload inside transform
-                        set_payload = dw_elem.xpath('.//ee:set-payload', namespaces=namespaces)
-                        if set_payload and set_payload[0].text:
-                            dw_code = set_payload[0].text
+                        set_payload = next(dw_elem.iter(_EE_SET_PAYLOAD_TAG), None)
+                        if set_payload is not None and set_payload.text:
+                            dw_code = set_payload.text
                             
-                    elif dw_elem.tag.endswith('set-payload') and dw_elem.text and '%dw' in dw_elem.text:
-                        dw_code = dw_elem.text
+                    elif dw_elem.tag.endswith('set-payload'):
+                        # DataWeave scripts open with the %dw header
+                        text = dw_elem.text
+                        if text and text.lstrip().startswith('%dw'):
+                            dw_code = text
                     
                     if dw_code:
                         # Extract info from the DataWeave code
@@ -477,22 +752,19 @@ def parse_xml_files(xml_files: List[str], interface_name: str = "MuleSoft Interf
                 interface.add_flow(flow)
             
             # Find configurations
-            config_elements = root.xpath('//mule:configuration', namespaces=namespaces)
-            for config_elem in config_elements:
+            for config_elem in root.iter(_CONFIGURATION_TAG):
                 config_name = config_elem.get('name', 'default')
-                if config_name not in interface.configs:
-                    interface.configs[config_name] = {'properties': {}}
+                if config_name not in interface.global_configs:
+                    interface.global_configs[config_name] = {'properties': {}}
                 
                 # Extract properties
-                property_elements = config_elem.xpath('.//mule:property', namespaces=namespaces)
-                for prop_elem in property_elements:
+                for prop_elem in config_elem.iter(_PROPERTY_TAG):
                     prop_name = prop_elem.get('name')
                     prop_value = prop_elem.get('value')
                     if prop_name and prop_value:
-                        interface.configs[config_name]['properties'][prop_name] = prop_value
+                        interface.global_configs[config_name]['properties'][prop_name] = prop_value
             
-        except Exception as e:
-            print(f"Error parsing XML file {xml_file}: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing XML file %s", xml_file)
     
     return interface 
\ No newline at end of file
@@ -3,14 +3,117 @@ YAML configuration parser for MuleSoft environment files.
 This module extracts configuration information from YAML files.
 """
 
+import functools
+import io
 import os
+import re
+import sys
+import logging
 import yaml
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterator, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Key patterns, matched against lower-cased property names.
+# Connection types
+_SFTP_RE = re.compile(r'sftp')
+_DB_RE = re.compile(r'db|database|jdbc')
+_HTTP_RE = re.compile(r'http|api|rest|soap')
+_FILE_RE = re.compile(r'file|directory|path')
+
+# Credentials, and the subset of them whose values must be masked
+_CRED_RE = re.compile(r'user|username|password|credential|secret|key|token|auth')
+_SECRET_RE = re.compile(r'password|secret|key|token')
+
+# Property categories
+_CONN_RE = re.compile(r'host|port|url|connection|server')
+_ENDPOINT_RE = re.compile(r'endpoint|api|path|route')
+_SECURITY_RE = re.compile(r'auth|token|key|secret|password|user|cert')
+_FILE_PATH_RE = re.compile(r'file|path|directory|folder')
+_TIMEOUT_RE = re.compile(r'timeout|interval|delay|ttl')
+_FEATURE_RE = re.compile(r'feature|flag|toggle|enable|disable')
+
+# Flags for reading YAML files raw; O_BINARY (Windows only) turns off the CRT's
+# CRLF translation and Ctrl-Z end-of-file handling
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+# Property category names, in display order
+PROPERTY_CATEGORIES = ('Connections', 'Endpoints', 'Security', 'File Paths', 'Timeouts', 'Features', 'Other')
+
+# Parser events that start a node (scalar, alias or collection)
+_NODE_EVENTS = (yaml.ScalarEvent, yaml.AliasEvent, yaml.CollectionStartEvent)
+
+# File name suffixes of environment configuration files
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+# Directories with more YAML files than this are parsed in worker processes
+# (on machines with more than one CPU). Starting the pool costs about 10 ms,
+# against well under 1 ms to parse a typical environment file of ~50 keys
+PARALLEL_PARSE_THRESHOLD = 16
+
+# Number of parsed files kept by load()
+PARSER_CACHE_SIZE = 256
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert a loaded YAML value into an equivalent hashable form.
+    
+    Equal values always freeze to equal results, so their hashes match.
+    
+    Args:
+        value: Value loaded from YAML
+    
+    Returns:
+        Hashable representation of the value
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+def _value_hash(value: Any) -> Optional[int]:
+    """Hash a loaded YAML value, or return None if it cannot be hashed."""
+    try:
+        return hash(_freeze(value))
+    except TypeError:
+        return None
+
+def _intern_keys(mapping: Dict[Any, Any]) -> Dict[Any, Any]:
+    """
+    Copy a mapping with its string keys interned.
+    
+    Args:
+        mapping: Mapping to copy
+    
+    Returns:
+        Dictionary whose string keys are shared with every other interned copy
+    """
+    return {sys.intern(k) if isinstance(k, str) else k: v for k, v in mapping.items()}
+
+class _ScanResult(NamedTuple):
+    """Views derived from a single pass over a configuration."""
+    connections: Dict[str, Dict[str, Any]]
+    credentials: Dict[str, Any]
+    raw_credentials: Dict[str, Any]
+    categories: Dict[str, Dict[str, Any]]
 
 class YamlConfigParser:
     """Parser for MuleSoft YAML configuration files."""
     
+    # No per-instance __dict__: directory runs keep one parser per environment
+    __slots__ = ('yaml_file_path', 'config', '_scan_cache', '_hash_cache')
+    
     def __init__(self, yaml_file_path: str):
         """
         Initialize with a YAML file path.
@@ -19,18 +122,80 @@ class YamlConfigParser:
             yaml_file_path: Path to the YAML configuration file
         """
         self.yaml_file_path = yaml_file_path
-        self.config = None
+        self.config = {}
+        self._scan_cache = None
+        self._hash_cache = None
         self.parse()
     
     def parse(self) -> None:
         """Parse the YAML file and load the configuration."""
+        # Drop views derived from a previous load
+        self._scan_cache = None
+        self._hash_cache = None
+        
         try:
-            with open(self.yaml_file_path, 'r') as file:
-                self.config = yaml.safe_load(file)
-        except Exception as e:
-            print(f"Error parsing YAML file {self.yaml_file_path}: {e}")
+            # Read the raw bytes straight from the descriptor, sized by fstat,
+            # and hand the whole buffer to the loader, which detects and
+            # decodes UTF-8 itself
+            fd = os.open(self.yaml_file_path, _READ_FLAGS)
+            try:
+                data = os.read(fd, os.fstat(fd).st_size)
+                # A single read may come back short (very large or growing files)
+                chunk = os.read(fd, io.DEFAULT_BUFFER_SIZE)
+                while chunk:
+                    data += chunk
+                    chunk = os.read(fd, io.DEFAULT_BUFFER_SIZE)
+            finally:
+                os.close(fd)
+            config = yaml.load(data, Loader=_Loader)
+            
+            # Only a mapping is a usable configuration (an empty file loads as
+            # None). Share one string object per key name across environments
+            if isinstance(config, dict):
+                self.config = _intern_keys(config)
+            else:
+                self.config = {}
+        except Exception:
+            logger.exception("Error parsing YAML file %s", self.yaml_file_path)
             self.config = {}
     
+    def parse_shallow(self) -> List[str]:
+        """
+        Collect the top-level property names without building the document.
+        
+        Walks the parser event stream and stops at the end of the root
+        mapping, so nested values are never constructed. Use parse() when
+        the values themselves are needed.
+        
+        Returns:
+            Top-level keys as written in the file (empty if the root is not a mapping)
+        """
+        keys = []
+        depth = 0
+        expect_key = True
+        
+        try:
+            with open(self.yaml_file_path, 'rb') as file:
+                for event in yaml.parse(file, Loader=_Loader):
+                    # Nodes directly inside the root mapping alternate key, value
+                    if depth == 1 and isinstance(event, _NODE_EVENTS):
+                        if expect_key and isinstance(event, yaml.ScalarEvent):
+                            keys.append(event.value)
+                        expect_key = not expect_key
+                    
+                    if isinstance(event, yaml.CollectionStartEvent):
+                        if depth == 0 and not isinstance(event, yaml.MappingStartEvent):
+                            break
+                        depth += 1
+                    elif isinstance(event, yaml.CollectionEndEvent):
+                        depth -= 1
+                        if depth == 0:
+                            break
+        except (OSError, yaml.YAMLError):
+            logger.exception("Error parsing YAML file %s", self.yaml_file_path)
+        
+        return keys
+    
     def get_environment_name(self) -> str:
         """
         Extract environment name from the file name.
@@ -49,65 +214,20 @@ class YamlConfigParser:
         Returns:
             Dictionary of all configurations
         """
-        return self.config or {}
+        return self.config
     
     def get_connection_details(self) -> Dict[str, Dict[str, Any]]:
         """
-        Extract connection details from the configuration.
+        Get connection details from the configuration.
         
         Returns:
             Dictionary of connection details
         """
-        result = {}
-        
-        if not self.config:
-            return result
-        
-        # Look for common connection patterns in MuleSoft YAML files
-        for key, value in self.config.items():
-            # SFTP connection details
-            if 'sftp' in key.lower() and isinstance(value, dict):
-                connection_type = 'SFTP'
-                result[key] = {
-                    'type': connection_type,
-                    'details': value
-                }
-            
-            # Database connection details
-            elif any(db_term in key.lower() for db_term in ['db', 'database', 'jdbc']) and isinstance(value, dict):
-                connection_type = 'Database'
-                result[key] = {
-                    'type': connection_type,
-                    'details': value
-                }
-            
-            # HTTP/API connection details
-            elif any(http_term in key.lower() for http_term in ['http', 'api', 'rest', 'soap']) and isinstance(value, dict):
-                connection_type = 'HTTP/API'
-                result[key] = {
-                    'type': connection_type,
-                    'details': value
-                }
-            
-            # File system details
-            elif any(file_term in key.lower() for file_term in ['file', 'directory', 'path']) and isinstance(value, (dict, str)):
-                connection_type = 'File System'
-                if isinstance(value, str):
-                    result[key] = {
-                        'type': connection_type,
-                        'details': {'path': value}
-                    }
-                else:
-                    result[key] = {
-                        'type': connection_type,
-                        'details': value
-                    }
-        
-        return result
+        return self._scan_result.connections
     
     def get_credentials(self, sanitize: bool = True) -> Dict[str, Dict[str, Any]]:
         """
-        Extract credential information (sanitized by default).
+        Get credential information (sanitized by default).
         
         Args:
             sanitize: Whether to mask credential values
@@ -115,76 +235,128 @@ class YamlConfigParser:
         Returns:
             Dictionary of credential information
         """
-        result = {}
-        
-        if not self.config:
-            return result
-        
-        # Look for credential patterns
-        for key, value in self.config.items():
-            if any(cred_term in key.lower() for cred_term in ['user', 'username', 'password', 'credential', 'secret', 'key', 'token', 'auth']):
-                if isinstance(value, dict):
-                    sanitized_value = {}
-                    for k, v in value.items():
-                        if sanitize and any(secret_term in k.lower() for secret_term in ['password', 'secret', 'key', 'token']):
-                            sanitized_value[k] = '********'
-                        else:
-                            sanitized_value[k] = v
-                    result[key] = sanitized_value
-                else:
-                    if sanitize and any(secret_term in key.lower() for secret_term in ['password', 'secret', 'key', 'token']):
-                        result[key] = '********'
-                    else:
-                        result[key] = value
-        
-        return result
+        scan = self._scan_result
+        return scan.credentials if sanitize else scan.raw_credentials
     
     def get_property_categories(self) -> Dict[str, Dict[str, Any]]:
         """
-        Categorize properties by their likely purpose.
+        Get properties categorized by their likely purpose.
         
         Returns:
             Dictionary of categorized properties
         """
-        categories = {
-            'Connections': {},
-            'Endpoints': {},
-            'Security': {},
-            'File Paths': {},
-            'Timeouts': {},
-            'Features': {},
-            'Other': {}
-        }
+        return self._scan_result.categories
+    
+    @property
+    def _key_hashes(self) -> Dict[str, Optional[int]]:
+        """Hash of each top-level value, computed once for environment comparisons."""
+        if self._hash_cache is None:
+            self._hash_cache = {key: _value_hash(value) for key, value in self.config.items()}
+        return self._hash_cache
+    
+    def _reintern_keys(self) -> None:
+        """
+        Intern the keys again after the parser came back from a worker process.
+        
+        Unpickling creates fresh key strings, so the configuration and any
+        views already computed are rebuilt around the interned ones.
+        """
+        self.config = _intern_keys(self.config)
+        if self._hash_cache is not None:
+            self._hash_cache = _intern_keys(self._hash_cache)
+        if self._scan_cache is not None:
+            scan = self._scan_cache
+            self._scan_cache = _ScanResult(
+                _intern_keys(scan.connections),
+                _intern_keys(scan.credentials),
+                _intern_keys(scan.raw_credentials),
+                {name: _intern_keys(props) for name, props in scan.categories.items()}
+            )
+    
+    @property
+    def _scan_result(self) -> _ScanResult:
+        """Derived views, computed on first access and reused afterwards."""
+        if self._scan_cache is None:
+            self._scan_cache = self._scan()
+        return self._scan_cache
+    
+    def _scan(self) -> _ScanResult:
+        """
+        Classify every property in one pass over the configuration.
+        
+        Each key is lower-cased once and then checked for connection details,
+        credentials and its property category.
+        
+        Returns:
+            Connection details, sanitized and raw credentials, and categorized properties
+        """
+        connections = {}
+        credentials = {}
+        raw_credentials = {}
+        categories = {name: {} for name in PROPERTY_CATEGORIES}
         
         if not self.config:
-            return categories
+            return _ScanResult(connections, credentials, raw_credentials, categories)
         
         for key, value in self.config.items():
+            lk = key.lower()
+            
+            # Look for common connection patterns in MuleSoft YAML files
+            if isinstance(value, dict):
+                # SFTP connection details
+                if _SFTP_RE.search(lk):
+                    connections[key] = {'type': 'SFTP', 'details': value}
+                
+                # Database connection details
+                elif _DB_RE.search(lk):
+                    connections[key] = {'type': 'Database', 'details': value}
+                
+                # HTTP/API connection details
+                elif _HTTP_RE.search(lk):
+                    connections[key] = {'type': 'HTTP/API', 'details': value}
+                
+                # File system details
+                elif _FILE_RE.search(lk):
+                    connections[key] = {'type': 'File System', 'details': value}
+            elif isinstance(value, str) and _FILE_RE.search(lk):
+                connections[key] = {'type': 'File System', 'details': {'path': value}}
+            
+            # Look for credential patterns (masked copy plus raw values); secret
+            # terms are a subset of credential terms, so the secret check for a
+            # scalar value is made here once and reused for the Security category
+            secret = False
+            if _CRED_RE.search(lk):
+                if isinstance(value, dict):
+                    credentials[key] = {k: '********' if _SECRET_RE.search(k.lower()) else v
+                                        for k, v in value.items()}
+                    raw_credentials[key] = dict(value)
+                else:
+                    secret = _SECRET_RE.search(lk) is not None
+                    credentials[key] = '********' if secret else value
+                    raw_credentials[key] = value
+            
             # Connection properties
-            if any(conn_term in key.lower() for conn_term in ['host', 'port', 'url', 'connection', 'server']):
+            if _CONN_RE.search(lk):
                 categories['Connections'][key] = value
             
             # Endpoint properties
-            elif any(endpoint_term in key.lower() for endpoint_term in ['endpoint', 'api', 'path', 'route']):
+            elif _ENDPOINT_RE.search(lk):
                 categories['Endpoints'][key] = value
             
             # Security properties
-            elif any(security_term in key.lower() for security_term in ['auth', 'token', 'key', 'secret', 'password', 'user', 'cert']):
-                if isinstance(value, str) and any(secret_term in key.lower() for secret_term in ['password', 'secret', 'key', 'token']):
-                    categories['Security'][key] = '********'
-                else:
-                    categories['Security'][key] = value
+            elif _SECURITY_RE.search(lk):
+                categories['Security'][key] = '********' if secret and isinstance(value, str) else value
             
             # File path properties
-            elif any(file_term in key.lower() for file_term in ['file', 'path', 'directory', 'folder']):
+            elif _FILE_PATH_RE.search(lk):
                 categories['File Paths'][key] = value
             
             # Timeout properties
-            elif any(timeout_term in key.lower() for timeout_term in ['timeout', 'interval', 'delay', 'ttl']):
+            elif _TIMEOUT_RE.search(lk):
                 categories['Timeouts'][key] = value
             
             # Feature flags or toggles
-            elif any(feature_term in key.lower() for feature_term in ['feature', 'flag', 'toggle', 'enable', 'disable']):
+            elif _FEATURE_RE.search(lk):
                 categories['Features'][key] = value
             
             # Everything else
@@ -192,21 +364,62 @@ class YamlConfigParser:
                 categories['Other'][key] = value
         
         # Remove empty categories
-        return {k: v for k, v in categories.items() if v}
+        categories = {k: v for k, v in categories.items() if v}
+        
+        return _ScanResult(connections, credentials, raw_credentials, categories)
+    
+@functools.lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _cached_parser(path: str, mtime_ns: int) -> YamlConfigParser:
+    """
+    Build a parser for a file version; mtime_ns only takes part in the cache key.
+    
+    Args:
+        path: Absolute path to the YAML configuration file
+        mtime_ns: Modification time of the file in nanoseconds
     
-def compare_environments(env1_file: str, env2_file: str) -> Dict[str, Any]:
+    Returns:
+        Parser with the configuration loaded
+    """
+    return YamlConfigParser(path)
+
+def load(path: str) -> YamlConfigParser:
+    """
+    Get a parser for a YAML file, reusing it while the file is unchanged.
+    
+    The returned parser is shared between callers and should not be modified.
+    
+    Args:
+        path: Path to the YAML configuration file
+    
+    Returns:
+        Parser with the configuration loaded
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        # Let the parser report the unreadable file as usual
+        return YamlConfigParser(path)
+    return _cached_parser(os.path.abspath(path), mtime_ns)
+
+def compare_environments(env1_file: str, env2_file: str,
+                         parser1: Optional[YamlConfigParser] = None,
+                         parser2: Optional[YamlConfigParser] = None) -> Dict[str, Any]:
     """
     Compare two environment configurations and highlight differences.
     
     Args:
         env1_file: Path to first environment file
         env2_file: Path to second environment file
+        parser1: Already-built parser for the first file, to avoid re-reading it
+        parser2: Already-built parser for the second file, to avoid re-reading it
     
     Returns:
         Dictionary with comparison results
     """
-    parser1 = YamlConfigParser(env1_file)
-    parser2 = YamlConfigParser(env2_file)
+    if parser1 is None:
+        parser1 = load(env1_file)
+    if parser2 is None:
+        parser2 = load(env2_file)
     
     env1_name = parser1.get_environment_name()
     env2_name = parser2.get_environment_name()
@@ -214,8 +427,9 @@ def compare_environments(env1_file: str, env2_file: str) -> Dict[str, Any]:
     env1_config = parser1.get_all_configurations()
     env2_config = parser2.get_all_configurations()
     
-    # Find keys in both configurations
-    all_keys = set(env1_config.keys()).union(set(env2_config.keys()))
+    # Split the keys with set operations on the dict key views
+    env1_keys = env1_config.keys()
+    env2_keys = env2_config.keys()
     
     result = {
         'env1': {
@@ -232,65 +446,172 @@ def compare_environments(env1_file: str, env2_file: str) -> Dict[str, Any]:
         'identical': {}
     }
     
-    for key in all_keys:
-        # Keys only in env1
-        if key in env1_config and key not in env2_config:
-            result['only_in_env1'][key] = env1_config[key]
-            continue
+    # Keys only in env1
+    for key in env1_keys - env2_keys:
+        result['only_in_env1'][key] = env1_config[key]
+    
+    # Keys only in env2
+    for key in env2_keys - env1_keys:
+        result['only_in_env2'][key] = env2_config[key]
+    
+    env1_hashes = parser1._key_hashes
+    env2_hashes = parser2._key_hashes
+    
+    for key in env1_keys & env2_keys:
+        value1 = env1_config[key]
+        value2 = env2_config[key]
         
-        # Keys only in env2
-        if key in env2_config and key not in env1_config:
-            result['only_in_env2'][key] = env2_config[key]
-            continue
+        # The same object is trivially identical. Otherwise different value
+        # hashes prove a difference; equal hashes are confirmed with a deep compare
+        if value1 is value2:
+            identical = True
+        else:
+            hash1 = env1_hashes[key]
+            hash2 = env2_hashes[key]
+            hashes_differ = hash1 is not None and hash2 is not None and hash1 != hash2
+            identical = not hashes_differ and value1 == value2
         
-        # Keys in both but with different values
-        if env1_config[key] != env2_config[key]:
+        if identical:
+            # Keys with identical values
+            result['identical'][key] = value1
+        else:
+            # Keys in both but with different values
             result['different_values'][key] = {
-                env1_name: env1_config[key],
-                env2_name: env2_config[key]
+                env1_name: value1,
+                env2_name: value2
             }
-        else:
-            # Keys with identical values
-            result['identical'][key] = env1_config[key]
     
     return result
 
-def parse_yaml_directory(directory_path: str) -> Dict[str, Any]:
+# Marks a LazyEnv entry that has not been computed yet
+_PENDING = object()
+
+class LazyEnv(MutableMapping):
+    """
+    Environment entry whose derived views are computed on first access.
+    
+    Returned by parse_yaml_directory(lazy=True). Has the same keys as the
+    plain environment dict, but the 'connections', 'credentials' and
+    'categories' entries are only asked of the parser when a caller reads
+    them. Not a dict subclass; use dict(env) to get a JSON-serializable copy.
+    """
+    
+    __slots__ = ('_parser', '_data')
+    
+    # Entry name -> parser method that produces it
+    _VIEWS = {
+        'connections': 'get_connection_details',
+        'credentials': 'get_credentials',
+        'categories': 'get_property_categories'
+    }
+    
+    def __init__(self, parser: YamlConfigParser, file_name: str):
+        """
+        Initialize the entry for a parsed environment file.
+        
+        Args:
+            parser: Parser with the environment's configuration loaded
+            file_name: Base name of the environment file
+        """
+        self._parser = parser
+        self._data = {
+            'file': file_name,
+            'configurations': parser.get_all_configurations()
+        }
+        # Placeholders keep the key order stable while views are filled in
+        self._data.update(dict.fromkeys(self._VIEWS, _PENDING))
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if value is _PENDING:
+            value = self._data[key] = getattr(self._parser, self._VIEWS[key])()
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __repr__(self) -> str:
+        return f"LazyEnv({self._data['file']!r})"
+
+def _parse_one(yaml_file: str) -> YamlConfigParser:
+    """
+    Parse a YAML file and compute its derived views.
+    
+    Kept at module level so it can be sent to worker processes.
+    
+    Args:
+        yaml_file: Path to the YAML configuration file
+    
+    Returns:
+        Parser with its configuration loaded and views already computed
+    """
+    parser = YamlConfigParser(yaml_file)
+    # Classify in the worker so the cached views travel back with the parser
+    parser._scan_result
+    return parser
+
+def parse_yaml_directory(directory_path: str, lazy: bool = False) -> Dict[str, Any]:
     """
     Parse all YAML files in a directory.
     
     Args:
         directory_path: Path to directory containing YAML files
+        lazy: Return each environment as a LazyEnv mapping that computes
+            'connections', 'credentials' and 'categories' on first access,
+            instead of a plain (JSON-serializable) dict
     
     Returns:
-        Dictionary with environment configurations and comparisons
+        Dictionary with environment configurations and comparisons; both are
+        empty when the directory does not exist or cannot be listed
     """
     result = {
         'environments': {},
         'comparisons': []
     }
     
-    yaml_files = []
+    parsers = {}
+    env_to_file = {}
     
-    # Find YAML files
-    for file_path in Path(directory_path).glob('*.yaml'):
-        yaml_files.append(str(file_path))
+    # Find YAML files in a single directory listing. A missing, unreadable or
+    # non-directory path has no environments, as with the earlier Path.glob
+    try:
+        with os.scandir(directory_path) as entries:
+            yaml_files = [entry.path for entry in entries
+                          if entry.name.endswith(YAML_SUFFIXES) and entry.is_file()]
+    except OSError as e:
+        logger.warning("Cannot list YAML directory %s: %s", directory_path, e)
+        return result
     
-    for file_path in Path(directory_path).glob('*.yml'):
-        yaml_files.append(str(file_path))
+    # Parse each YAML file, in parallel when there are enough of them and
+    # more than one CPU to spread them over
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(yaml_files) > PARALLEL_PARSE_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            file_parsers = list(executor.map(_parse_one, yaml_files))
+        for parser in file_parsers:
+            parser._reintern_keys()
+    elif lazy:
+        # Views are left for LazyEnv to compute if and when they are read
+        file_parsers = [YamlConfigParser(yaml_file) for yaml_file in yaml_files]
+    else:
+        file_parsers = [_parse_one(yaml_file) for yaml_file in yaml_files]
     
-    # Parse each YAML file
-    for yaml_file in yaml_files:
-        parser = YamlConfigParser(yaml_file)
+    for yaml_file, parser in zip(yaml_files, file_parsers):
         env_name = parser.get_environment_name()
+        parsers[env_name] = parser
+        env_to_file[env_name] = yaml_file
         
-        result['environments'][env_name] = {
-            'file': os.path.basename(yaml_file),
-            'configurations': parser.get_all_configurations(),
-            'connections': parser.get_connection_details(),
-            'credentials': parser.get_credentials(),
-            'categories': parser.get_property_categories()
-        }
+        env = LazyEnv(parser, os.path.basename(yaml_file))
+        result['environments'][env_name] = env if lazy else dict(env)
     
     # Generate comparisons if multiple environments exist
     env_names = list(result['environments'].keys())
@@ -300,10 +621,8 @@ def parse_yaml_directory(directory_path: str) -> Dict[str, Any]:
                 env1 = env_names[i]
                 env2 = env_names[j]
                 
-                env1_file = next(file for file in yaml_files if parser.get_environment_name() == env1)
-                env2_file = next(file for file in yaml_files if parser.get_environment_name() == env2)
-                
-                comparison = compare_environments(env1_file, env2_file)
+                comparison = compare_environments(env_to_file[env1], env_to_file[env2],
+                                                  parsers[env1], parsers[env2])
                 result['comparisons'].append(comparison)
     
     return result 
\ No newline at end of file